@@ -6,7 +6,13 @@ Serves the scoring API and renders the dashboard.
 import json
 import os
 import csv
+import gzip
+import hashlib
+import pickle
 import re
+import stat
+import sys
+import threading
 from io import BytesIO
 from functools import lru_cache
 from flask import Flask, jsonify, render_template, request, abort
@@ -15,6 +21,7 @@ from engine.scoring import compute_lts
 from engine.lifecycle_scorer import compute_drift, get_pillar_labels, get_pillar_weights
 from engine.nlp_engine import extract_and_classify_claims, classify_claim
 import pdfplumber
+import pypdfium2 as pdfium
 import PyPDF2
 
 app = Flask(__name__)
@@ -22,8 +29,20 @@ CORS(app)
 
 DATA_PATH = os.path.join(os.path.dirname(__file__), "data", "companies.json")
 CSV_DATA_PATH = os.path.join(os.path.dirname(__file__), "EV Energy Efficiency Dataset.csv")
+COMPANY_CACHE_PATH = os.path.join(os.path.dirname(__file__), "data", "companies_cache.pkl")
 MAX_PDF_PAGES = 30
+MAX_CLAIMS = 120
+CSV_COLUMNS = ("Make", "Model", "Model year", "Motor (kW)", "Recharge time (h)", "Energy Efficiency (km/kWh)")
+ROW_MODEL = 0  # rows are stored as (model, model_year, motor_kw, recharge_h, efficiency)
 MAX_PDF_SIZE_BYTES = 60 * 1024 * 1024
+PDF_CACHE_DIR = os.path.join(app.instance_path, "pdf_cache")  # private to the app user, see _pdf_cache_dir
+PDF_CACHE_MAX_ENTRIES = 256
+PIPELINE_VERSION = "5"  # bump whenever extraction or scoring output changes
+MAX_CACHED_CLAIM_CHARS = 512  # longer claim texts are not kept in the per-process lru caches
+GZIP_MIN_BYTES = 1024  # smaller bodies are not worth the compression CPU
+# PDFium is not thread-safe, even across separate documents; gthread workers serve requests
+# on several threads, so every PDFium call goes through this lock
+_PDFIUM_LOCK = threading.Lock()
 
 PILLAR_KEYWORDS = {
     "raw_materials": ["lithium", "cobalt", "nickel", "mining", "mineral", "raw material"],
@@ -65,8 +84,56 @@ NON_EV_SIGNAL_TERMS = [
     "packaging", "consumer electronics"
 ]
 
+REGULATORY_MARKERS = {
+    "GRI": ["gri", "global reporting initiative"],
+    "CSRD": ["csrd"],
+    "SEC_Climate": ["sec climate", "sec rule"],
+    "TCFD": ["tcfd"],
+}
+
+# Highest-integrity tier first; the first tier mentioned anywhere in the report wins
+OFFSET_QUALITY_MARKERS = {
+    "Gold Standard": ["gold standard"],
+    "VCS": ["vcs", "verified carbon standard"],
+    "Unverified": ["offset", "carbon credit", "rec"],
+}
+
+OFFSET_DEPENDENCY_TERMS = ["offset", "carbon credit", "rec"]
+
+# Every report-wide estimate is a view over one tally of these categories
+REPORT_CATEGORIES = {
+    **{("pillar", p): kws for p, kws in PILLAR_KEYWORDS.items()},
+    **{("regulatory", s): kws for s, kws in REGULATORY_MARKERS.items()},
+    **{("offset_quality", q): kws for q, kws in OFFSET_QUALITY_MARKERS.items()},
+    ("offset_dependency", None): OFFSET_DEPENDENCY_TERMS,
+}
+_REPORT_TERMS = sorted({t for terms in REPORT_CATEGORIES.values() for t in terms})
+
+_EV_TERMS = tuple(
+    (category, term)
+    for category, terms in (
+        *EV_DOMAIN_TERMS.items(),
+        ("anchor", EV_AUTO_ANCHORS),
+        ("company", KNOWN_EV_COMPANIES),
+        ("non_ev", NON_EV_SIGNAL_TERMS),
+    )
+    for term in terms
+)
+_EV_WEIGHTS = {"core": 3, "vehicle": 2, "supply": 1, "anchor": 4, "company": 3, "non_ev": -2}
+_EV_MAX_TERM_LEN = max(len(term) for _, term in _EV_TERMS)
+EV_DOMAIN_MIN_SCORE = 12
+EV_SCAN_CHARS = 180000
+EV_SCAN_BLOCK = 4096  # the early-exit check runs after each block
+
+# ASCII outside [a-z0-9] maps to "-"; runs of "-" are collapsed by split/join in _slugify
+_SLUG_TABLE = str.maketrans({chr(c): "-" for c in range(128) if not chr(c).isdigit() and not "a" <= chr(c) <= "z"})
+
+
 def _slugify(text: str) -> str:
-    return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
+    lowered = text.lower()
+    if not lowered.isascii():
+        return re.sub(r"[^a-z0-9]+", "-", lowered).strip("-")
+    return "-".join(filter(None, lowered.translate(_SLUG_TABLE).split("-")))
 
 
 def _safe_float(value, default=0.0):
@@ -86,7 +153,7 @@ def _logo_for_make(make: str) -> str:
 
 
 def _hash_bucket(text: str, mod=100):
-    return sum(ord(ch) for ch in (text or "")) % mod
+    return sum(map(ord, text or "")) % mod
 
 
 def _build_claims(make: str, avg_eff: float, avg_motor: float, avg_recharge: float):
@@ -129,17 +196,38 @@ def _build_claims(make: str, avg_eff: float, avg_motor: float, avg_recharge: flo
     ]
 
 
-def _build_company_from_make(make: str, rows: list[dict]):
-    efficiencies = [_safe_float(r.get("Energy Efficiency (km/kWh)"), 0) for r in rows]
-    motors = [_safe_float(r.get("Motor (kW)"), 0) for r in rows]
-    recharges = [_safe_float(r.get("Recharge time (h)"), 0) for r in rows]
-    years = [_safe_float(r.get("Model year"), 2024) for r in rows]
-    models = sorted({r.get("Model", "").strip() for r in rows if r.get("Model", "").strip()})
+def _summarize_rows(rows: list[tuple]):
+    """Aggregate CSV rows for one make (or model) in a single pass."""
+    eff_total = motor_total = recharge_total = 0.0
+    year_min = year_max = None
+    models = set()
+    for model, year, motor, recharge, eff in rows:
+        eff_total += eff
+        motor_total += motor
+        recharge_total += recharge
+        year_min = year if year_min is None else min(year_min, year)
+        year_max = year if year_max is None else max(year_max, year)
+        if model:
+            models.add(model)
+
+    count = max(1, len(rows))
+    return {
+        "avg_eff": eff_total / count,
+        "avg_motor": motor_total / count,
+        "avg_recharge": recharge_total / count,
+        "year_min": int(year_min if year_min is not None else 2024),
+        "year_max": int(year_max if year_max is not None else 2024),
+        "models": sorted(models),
+    }
+
 
-    avg_eff = sum(efficiencies) / max(1, len(efficiencies))
-    avg_motor = sum(motors) / max(1, len(motors))
-    avg_recharge = sum(recharges) / max(1, len(recharges))
-    report_year = int(max(years) if years else 2024)
+def _build_company_from_make(make: str, summary: dict, rows: list[tuple]):
+    avg_eff = summary["avg_eff"]
+    avg_motor = summary["avg_motor"]
+    avg_recharge = summary["avg_recharge"]
+    min_year = summary["year_min"]
+    report_year = summary["year_max"]
+    models = summary["models"]
 
     bucket = _hash_bucket(make, 40)
     use_phase = _clamp(20 + (avg_eff * 10), 25, 95)
@@ -169,7 +257,6 @@ def _build_company_from_make(make: str, rows: list[dict]):
         "TCFD": bucket % 5 in (0, 1),
     }
 
-    min_year = int(min(years) if years else report_year)
     model_count = len(models)
     model_label = f"{model_count} EV models ({min_year}-{report_year})"
 
@@ -191,36 +278,97 @@ def _build_company_from_make(make: str, rows: list[dict]):
     }
 
 
-def _build_company_from_model(make: str, model_name: str, rows: list[dict]):
-    base = _build_company_from_make(make, rows)
+def _build_company_from_model(make: str, model_name: str, rows: list[tuple]):
+    summary = _summarize_rows(rows)
+    base = _build_company_from_make(make, summary, rows)
     model_count = len(rows)
-    year_values = [_safe_float(r.get("Model year"), base.get("report_year", 2024)) for r in rows]
-    min_year = int(min(year_values) if year_values else base.get("report_year", 2024))
-    max_year = int(max(year_values) if year_values else base.get("report_year", 2024))
+    min_year = summary["year_min"]
+    max_year = summary["year_max"]
     base["id"] = f"{base['id']}--model-{_slugify(model_name)}"
     base["model"] = f"{model_name} ({model_count} records, {min_year}-{max_year})"
     base["models"] = [model_name]
     return base
 
 
+def _intern_claim_types(companies: list[dict]):
+    """
+    Unpickled or JSON-loaded claim types are fresh string copies; interning them lets the
+    scorer's claim["type"] == "VAGUE" checks succeed on identity instead of comparing bytes.
+    """
+    for company in companies:
+        for claim in company.get("claims", []):
+            if isinstance(claim.get("type"), str):
+                claim["type"] = sys.intern(claim["type"])
+    return companies
+
+
+def _read_company_cache(stamp: tuple):
+    try:
+        with open(COMPANY_CACHE_PATH, "rb") as f:
+            cached = pickle.load(f)
+        if cached.get("stamp") != stamp:
+            return None
+        companies = cached["companies"]
+    except Exception:
+        # Unreadable, or not the {"stamp", "companies"} dict we write: rebuild from the CSV
+        return None
+    return _intern_claim_types(companies)
+
+
+def _write_company_cache(stamp: tuple, companies: list[dict]):
+    tmp_path = f"{COMPANY_CACHE_PATH}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            pickle.dump({"stamp": stamp, "companies": companies}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, COMPANY_CACHE_PATH)
+    except OSError:
+        pass
+
+
 @lru_cache(maxsize=1)
 def _load_companies_from_csv():
     if not os.path.exists(CSV_DATA_PATH):
         return None
 
+    # Disk cache survives worker restarts; any change to the CSV, the pipeline or this file
+    # (which builds the companies) rebuilds it
+    st = os.stat(CSV_DATA_PATH)
+    stamp = (PIPELINE_VERSION, st.st_mtime_ns, st.st_size, os.stat(__file__).st_mtime_ns)
+    cached = _read_company_cache(stamp)
+    if cached is not None:
+        return cached
+
     grouped = {}
     with open(CSV_DATA_PATH, "r", encoding="utf-8-sig", newline="") as f:
-        reader = csv.DictReader(f)
+        reader = csv.reader(f)
+        header = next(reader, [])
+        positions = [header.index(c) if c in header else None for c in CSV_COLUMNS]
         for row in reader:
-            make = (row.get("Make") or "").strip()
+            if not row:
+                continue
+            # Missing columns and short rows read as empty, as they did with DictReader
+            make, model, year, motor, recharge, eff = (
+                row[i] if i is not None and i < len(row) else "" for i in positions
+            )
+            make = make.strip()
             if not make:
                 continue
-            grouped.setdefault(make, []).append(row)
+            grouped.setdefault(make, []).append((
+                model.strip(),
+                _safe_float(year, 2024),
+                _safe_float(motor, 0),
+                _safe_float(recharge, 0),
+                _safe_float(eff, 0),
+            ))
 
     if not grouped:
         return None
 
-    companies = [_build_company_from_make(make, rows) for make, rows in sorted(grouped.items())]
+    companies = [
+        _build_company_from_make(make, _summarize_rows(rows), rows)
+        for make, rows in sorted(grouped.items())
+    ]
+    _write_company_cache(stamp, companies)
     return companies
 
 
@@ -229,34 +377,60 @@ def load_companies():
     if csv_companies:
         return csv_companies
     with open(DATA_PATH, "r") as f:
-        return json.load(f)["companies"]
+        return _intern_claim_types(json.load(f)["companies"])
 
-def get_company_by_id(company_id: str):
-    companies = load_companies()
-    for c in companies:
-        if c["id"] == company_id:
-            return c
-    return None
+@lru_cache(maxsize=1)
+def _companies_by_id():
+    index = {}
+    for c in load_companies():
+        index.setdefault(c["id"], c)  # first entry wins, as with the old linear scan
+    return index
 
 
-def _extract_pdf_text(file_bytes: bytes):
-    text_parts = []
-    page_count = 0
+def get_company_by_id(company_id: str):
+    return _companies_by_id().get(company_id)
+
 
-    # Strategy 1: pdfplumber text + word extraction fallback per page
+def _extract_pages_pdfplumber(file_bytes: bytes, page_indices: list[int]):
+    """pdfplumber text for the given pages, with a word-extraction fallback per page."""
+    texts = []
     with pdfplumber.open(BytesIO(file_bytes)) as pdf:
-        for page in pdf.pages[:MAX_PDF_PAGES]:
-            page_count += 1
+        for i in page_indices:
+            page = pdf.pages[i]
             page_text = page.extract_text() or ""
             if not page_text.strip():
                 words = page.extract_words() or []
                 page_text = " ".join(w.get("text", "") for w in words)
-            if page_text.strip():
-                text_parts.append(page_text)
+            texts.append(page_text)
+    return texts
+
+
+def _extract_pdf_text(file_bytes: bytes):
+    # Strategy 1: PDFium (native C) text extraction per page, one thread at a time
+    with _PDFIUM_LOCK:
+        pdf = pdfium.PdfDocument(file_bytes)
+        try:
+            page_count = min(len(pdf), MAX_PDF_PAGES)
+            page_texts = []
+            for i in range(page_count):
+                page = pdf[i]
+                textpage = page.get_textpage()
+                page_texts.append(textpage.get_text_range().replace("\r\n", "\n"))
+                textpage.close()
+                page.close()
+        finally:
+            pdf.close()
+
+    # Strategy 2: pdfplumber layout analysis, only for pages PDFium returned empty
+    empty_pages = [i for i, t in enumerate(page_texts) if not t.strip()]
+    if empty_pages:
+        for i, text in zip(empty_pages, _extract_pages_pdfplumber(file_bytes, empty_pages)):
+            page_texts[i] = text
+    text_parts = [t for t in page_texts if t.strip()]
 
     merged = "\n".join(text_parts).strip()
 
-    # Strategy 2: PyPDF2 if pdfplumber extraction is sparse
+    # Strategy 3: PyPDF2 if extraction is still sparse
     if len(merged) < 1200:
         reader = PyPDF2.PdfReader(BytesIO(file_bytes))
         page_count = min(len(reader.pages), MAX_PDF_PAGES)
@@ -270,7 +444,63 @@ def _extract_pdf_text(file_bytes: bytes):
     return merged, page_count
 
 
-def _infer_pillar(claim_text: str):
+def _pdf_cache_key(file_bytes: bytes, filename: str) -> str:
+    # The filename feeds the report name and EV domain detection, so it is part of the key
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{PIPELINE_VERSION}\0{filename}\0".encode("utf-8"))
+    digest.update(file_bytes)
+    return digest.hexdigest()
+
+
+def _pdf_cache_dir():
+    """PDF_CACHE_DIR, created mode 0o700; None if it exists but is not ours alone."""
+    try:
+        os.makedirs(PDF_CACHE_DIR, mode=0o700, exist_ok=True)
+        st = os.lstat(PDF_CACHE_DIR)
+    except OSError:
+        return None
+    if not stat.S_ISDIR(st.st_mode):
+        return None
+    # Uploaded reports are private: refuse a directory another user owns or can read or plant entries in
+    if hasattr(os, "getuid") and (st.st_uid != os.getuid() or st.st_mode & 0o077):
+        return None
+    return PDF_CACHE_DIR
+
+
+def _pdf_cache_get(key: str):
+    cache_dir = _pdf_cache_dir()
+    if cache_dir is None:
+        return None
+    try:
+        with open(os.path.join(cache_dir, f"{key}.json"), "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _pdf_cache_put(key: str, result: dict):
+    """Store a result on disk (shared by all workers); cache failures never fail the request."""
+    cache_dir = _pdf_cache_dir()
+    if cache_dir is None:
+        return
+    path = os.path.join(cache_dir, f"{key}.json")
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, "w") as f:
+            json.dump(result, f)
+        os.replace(tmp_path, path)
+
+        entries = [os.path.join(cache_dir, n) for n in os.listdir(cache_dir) if n.endswith(".json")]
+        if len(entries) > PDF_CACHE_MAX_ENTRIES:
+            entries.sort(key=os.path.getmtime)
+            for old in entries[:len(entries) - PDF_CACHE_MAX_ENTRIES]:
+                os.remove(old)
+    except OSError:
+        pass
+
+
+def _pillar_for(claim_text: str):
+    """Pillar whose keywords the claim mentions most; supply_chain when none match."""
     claim_lower = claim_text.lower()
     scores = {}
     for pillar, keywords in PILLAR_KEYWORDS.items():
@@ -279,11 +509,31 @@ def _infer_pillar(claim_text: str):
     return best if scores[best] > 0 else "supply_chain"
 
 
-def _estimate_pillar_scores(text: str):
-    text_lower = text.lower()
+_pillar_for_cached = lru_cache(maxsize=8192)(_pillar_for)
+
+
+def _infer_pillar(claim_text: str):
+    """_pillar_for, memoized for claims short enough to keep."""
+    # An unpunctuated PDF is one "sentence" of up to the whole text; caching those could hold gigabytes
+    if len(claim_text) > MAX_CACHED_CLAIM_CHARS:
+        return _pillar_for(claim_text)
+    return _pillar_for_cached(claim_text)
+
+
+def _scan_report(text_lower: str) -> dict:
+    """Tally keyword hits per report category; each distinct term is counted once."""
+    # str.count runs in C and beats a single regex pass over the report at these sizes
+    term_counts = {t: text_lower.count(t) for t in _REPORT_TERMS}
+    return {
+        category: sum(term_counts[t] for t in terms)
+        for category, terms in REPORT_CATEGORIES.items()
+    }
+
+
+def _estimate_pillar_scores(report_hits: dict):
     output = {}
-    for pillar, keywords in PILLAR_KEYWORDS.items():
-        hits = sum(text_lower.count(kw) for kw in keywords)
+    for pillar in PILLAR_KEYWORDS:
+        hits = report_hits.get(("pillar", pillar), 0)
         if hits == 0:
             score = 22
         elif hits < 3:
@@ -294,27 +544,21 @@ def _estimate_pillar_scores(text: str):
     return output
 
 
-def _estimate_regulatory_alignment(text: str):
-    text_lower = text.lower()
-    return {
-        "GRI": ("gri" in text_lower) or ("global reporting initiative" in text_lower),
-        "CSRD": "csrd" in text_lower,
-        "SEC_Climate": ("sec climate" in text_lower) or ("sec rule" in text_lower),
-        "TCFD": "tcfd" in text_lower,
-    }
+def _estimate_regulatory_alignment(report_hits: dict):
+    return {standard: report_hits.get(("regulatory", standard), 0) > 0 for standard in REGULATORY_MARKERS}
 
 
-def _estimate_offset_quality(text: str):
-    text_lower = text.lower()
-    if "gold standard" in text_lower:
-        return "Gold Standard"
-    if "vcs" in text_lower or "verified carbon standard" in text_lower:
-        return "VCS"
-    if "offset" in text_lower or "carbon credit" in text_lower or "rec" in text_lower:
-        return "Unverified"
+def _estimate_offset_quality(report_hits: dict):
+    for quality in OFFSET_QUALITY_MARKERS:
+        if report_hits.get(("offset_quality", quality), 0):
+            return quality
     return "None"
 
 
+def _estimate_offset_dependency(report_hits: dict):
+    return min(90, report_hits.get(("offset_dependency", None), 0) * 3)
+
+
 def _fallback_claims_from_lines(text: str):
     claims = []
     for line in text.splitlines():
@@ -323,34 +567,43 @@ def _fallback_claims_from_lines(text: str):
             continue
         c = classify_claim(cleaned)
         claims.append({"text": cleaned, **c})
-        if len(claims) >= 120:
+        if len(claims) >= MAX_CLAIMS:
             break
     return claims
 
 
-def _detect_ev_domain(text: str, filename: str):
-    content = f"{filename} {text[:180000]}".lower()
-
-    core_hits = [t for t in EV_DOMAIN_TERMS["core"] if t in content]
-    vehicle_hits = [t for t in EV_DOMAIN_TERMS["vehicle"] if t in content]
-    supply_hits = [t for t in EV_DOMAIN_TERMS["supply"] if t in content]
-    anchor_hits = [t for t in EV_AUTO_ANCHORS if t in content]
-    company_hits = [t for t in KNOWN_EV_COMPANIES if t in content]
-    non_ev_hits = [t for t in NON_EV_SIGNAL_TERMS if t in content]
-
-    # Weighted EV relevance score
-    score = (
-        (len(core_hits) * 3)
-        + (len(vehicle_hits) * 2)
-        + (len(supply_hits))
-        + (len(anchor_hits) * 4)
-        + (len(company_hits) * 3)
-        - (len(non_ev_hits) * 2)
-    )
+def _detect_ev_domain(text_lower: str, filename: str):
+    # The filename plus enough of the text to catch a term spanning the joining space
+    head = f"{filename.lower()} {text_lower[:_EV_MAX_TERM_LEN - 1]}"
+    found = {hit for hit in _EV_TERMS if hit[1] in head}
+    # Blocks come straight from the text and overlap by one term length, so a term spanning
+    # a block boundary still matches; scanning stops at EV_SCAN_CHARS
+    scan_end = min(len(text_lower), EV_SCAN_CHARS)
+    for start in range(0, scan_end, EV_SCAN_BLOCK):
+        block = text_lower[start:min(start + EV_SCAN_BLOCK + _EV_MAX_TERM_LEN - 1, scan_end)]
+        found.update(hit for hit in _EV_TERMS if hit not in found and hit[1] in block)
+        if not any(category in ("anchor", "company") for category, _ in found):
+            continue
+        # Stop once even every unseen non-EV term (each weighted negative) could not pull the score under the bar
+        running = sum(_EV_WEIGHTS[category] for category, _ in found)
+        unseen_non_ev = len(NON_EV_SIGNAL_TERMS) - sum(1 for category, _ in found if category == "non_ev")
+        if running + _EV_WEIGHTS["non_ev"] * unseen_non_ev >= EV_DOMAIN_MIN_SCORE:
+            break
+
+    # Keep each category in declaration order, as the UI lists the first few
+    core_hits = [t for t in EV_DOMAIN_TERMS["core"] if ("core", t) in found]
+    vehicle_hits = [t for t in EV_DOMAIN_TERMS["vehicle"] if ("vehicle", t) in found]
+    supply_hits = [t for t in EV_DOMAIN_TERMS["supply"] if ("supply", t) in found]
+    anchor_hits = [t for t in EV_AUTO_ANCHORS if ("anchor", t) in found]
+    company_hits = [t for t in KNOWN_EV_COMPANIES if ("company", t) in found]
+    non_ev_hits = [t for t in NON_EV_SIGNAL_TERMS if ("non_ev", t) in found]
+
+    # Weighted EV relevance score, from the same weights the early exit relies on
+    score = sum(_EV_WEIGHTS[category] for category, _ in found)
 
     # Require stronger EV-specific evidence to avoid false positives in general sustainability reports.
     has_ev_specific_anchor = len(anchor_hits) >= 1 or len(company_hits) >= 1
-    is_ev_domain = has_ev_specific_anchor and score >= 12
+    is_ev_domain = has_ev_specific_anchor and score >= EV_DOMAIN_MIN_SCORE
 
     if is_ev_domain:
         recommendation = "EV domain confirmed. You can continue with full EV transparency scoring."
@@ -367,6 +620,81 @@ def _detect_ev_domain(text: str, filename: str):
     }
 
 
+def _json_body(payload) -> bytes:
+    """Serialize exactly as jsonify would, for responses that are built once and reused."""
+    return app.json.response(payload).get_data()
+
+
+@lru_cache(maxsize=1)
+def _companies_body():
+    return _json_body([
+        {
+            "id": c["id"],
+            "name": c["name"],
+            "logo": c["logo"],
+            "model": c["model"],
+            "model_count": len(c.get("models", [])),
+        }
+        for c in load_companies()
+    ])
+
+
+@lru_cache(maxsize=1)
+def _pillar_info_body():
+    return _json_body({
+        "labels": get_pillar_labels(),
+        "weights": get_pillar_weights()
+    })
+
+
+@lru_cache(maxsize=512)
+def _models_body(company_id: str):
+    company = get_company_by_id(company_id)
+    if not company:
+        return None
+    return _json_body({"company_id": company_id, "models": sorted(company.get("models", []))})
+
+
+def _accepts_gzip() -> bool:
+    # accept_encodings honours quality values, so "gzip;q=0" opts out
+    return request.accept_encodings["gzip"] > 0
+
+
+@lru_cache(maxsize=1024)
+def _gzip_prebuilt(body: bytes) -> bytes:
+    """Compressed form of a prebuilt JSON body, kept alongside the plain one."""
+    return gzip.compress(body, compresslevel=6)
+
+
+def _cached_json_response(body: bytes):
+    response = app.response_class(body, mimetype=app.json.mimetype)
+    if len(body) >= GZIP_MIN_BYTES and _accepts_gzip():
+        response.set_data(_gzip_prebuilt(body))
+        response.headers["Content-Encoding"] = "gzip"
+        response.vary.add("Accept-Encoding")
+    return response
+
+
+@app.after_request
+def _gzip_json(response):
+    """Gzip JSON responses (the PDF analysis carries up to 120 claims) for clients that accept it."""
+    if (
+        response.mimetype != app.json.mimetype
+        or response.direct_passthrough
+        or "Content-Encoding" in response.headers
+    ):
+        return response
+    body = response.get_data()
+    if len(body) < GZIP_MIN_BYTES:
+        return response
+    # Compressible, so caches must key on Accept-Encoding whether or not this client gets gzip
+    response.vary.add("Accept-Encoding")
+    if _accepts_gzip():
+        response.set_data(gzip.compress(body, compresslevel=6))
+        response.headers["Content-Encoding"] = "gzip"
+    return response
+
+
 # ── Routes ──────────────────────────────────────────────
 
 @app.route("/")
@@ -385,27 +713,15 @@ def dashboard():
 
 @app.route("/api/companies")
 def api_companies():
-    companies = load_companies()
-    return jsonify([
-        {
-            "id": c["id"],
-            "name": c["name"],
-            "logo": c["logo"],
-            "model": c["model"],
-            "model_count": len(c.get("models", [])),
-        }
-        for c in companies
-    ])
+    return _cached_json_response(_companies_body())
 
 
 @app.route("/api/models/<company_id>")
 def api_models(company_id):
-    company = get_company_by_id(company_id)
-    if not company:
+    body = _models_body(company_id)
+    if body is None:
         abort(404, description=f"Company '{company_id}' not found.")
-
-    models = sorted(company.get("models", []))
-    return jsonify({"company_id": company_id, "models": models})
+    return _cached_json_response(body)
 
 
 @app.route("/api/analyze/<company_id>")
@@ -417,7 +733,7 @@ def api_analyze(company_id):
     selected_model = (request.args.get("model") or "").strip()
     company_for_analysis = company
     if selected_model and company.get("__rows"):
-        model_rows = [r for r in company["__rows"] if (r.get("Model") or "").strip() == selected_model]
+        model_rows = [r for r in company["__rows"] if r[ROW_MODEL] == selected_model]
         if not model_rows:
             abort(404, description=f"Model '{selected_model}' not found for company '{company['name']}'.")
         company_for_analysis = _build_company_from_model(company["name"], selected_model, model_rows)
@@ -447,9 +763,10 @@ def api_compare():
         abort(400, description="Provide ?ids=company1,company2")
 
     ids = [i.strip() for i in ids_param.split(",") if i.strip()]
+    companies_by_id = _companies_by_id()
     results = []
     for cid in ids:
-        company = get_company_by_id(cid)
+        company = companies_by_id.get(cid)
         if company:
             r = compute_lts(company)
             r["id"] = cid
@@ -461,10 +778,7 @@ def api_compare():
 
 @app.route("/api/pillar-info")
 def api_pillar_info():
-    return jsonify({
-        "labels": get_pillar_labels(),
-        "weights": get_pillar_weights()
-    })
+    return _cached_json_response(_pillar_info_body())
 
 
 @app.route("/api/analyze-pdf", methods=["POST"])
@@ -478,10 +792,16 @@ def api_analyze_pdf():
     if not file.filename.lower().endswith(".pdf"):
         abort(400, description="Only .pdf files are supported.")
 
-    file_bytes = file.read()
+    # One byte past the limit is enough to reject an oversized upload without buffering all of it
+    file_bytes = file.read(MAX_PDF_SIZE_BYTES + 1)
     if len(file_bytes) > MAX_PDF_SIZE_BYTES:
         abort(400, description="PDF exceeds 60MB limit.")
 
+    cache_key = _pdf_cache_key(file_bytes, file.filename)
+    cached = _pdf_cache_get(cache_key)
+    if cached is not None:
+        return jsonify(cached)
+
     try:
         full_text, page_count = _extract_pdf_text(file_bytes)
     except Exception:
@@ -490,12 +810,12 @@ def api_analyze_pdf():
     if not full_text.strip():
         abort(400, description="No readable text found. Try a text-based PDF instead of a scanned image.")
 
-    domain_info = _detect_ev_domain(full_text, file.filename)
+    text_lower = full_text.lower()
+    domain_info = _detect_ev_domain(text_lower, file.filename)
 
-    claims = extract_and_classify_claims(full_text[:240000])
+    claims = extract_and_classify_claims(full_text[:240000], limit=MAX_CLAIMS)
     if not claims:
         claims = _fallback_claims_from_lines(full_text[:240000])
-    claims = claims[:120]
 
     if not claims:
         abort(400, description="Could not extract enough analyzable claims from this PDF.")
@@ -507,11 +827,12 @@ def api_analyze_pdf():
         claim_copy["verified"] = claim_copy["type"] == "NUMERIC"
         enriched_claims.append(claim_copy)
 
-    pillar_scores = _estimate_pillar_scores(full_text)
+    report_hits = _scan_report(text_lower)
+    pillar_scores = _estimate_pillar_scores(report_hits)
     prior_scores = {k: max(0, v - 4) for k, v in pillar_scores.items()}
-    regulatory = _estimate_regulatory_alignment(full_text)
-    offset_quality = _estimate_offset_quality(full_text)
-    offset_dependency = min(90, sum(full_text.lower().count(k) for k in ["offset", "carbon credit", "rec"]) * 3)
+    regulatory = _estimate_regulatory_alignment(report_hits)
+    offset_quality = _estimate_offset_quality(report_hits)
+    offset_dependency = _estimate_offset_dependency(report_hits)
 
     synthetic_company = {
         "name": os.path.splitext(file.filename)[0][:60],
@@ -535,9 +856,11 @@ def api_analyze_pdf():
     result["pages_processed"] = page_count
     result["claims_extracted"] = len(enriched_claims)
     result["domain_detection"] = domain_info
+    _pdf_cache_put(cache_key, result)
     return jsonify(result)
 
 
 if __name__ == "__main__":
+    # Local development only; production runs under gunicorn (see gunicorn_conf.py)
     print("🌿 AutoTruth server starting at http://localhost:5001")
-    app.run(debug=True, port=5001)
+    app.run(debug=os.environ.get("FLASK_DEBUG") == "1", port=5001)
@@ -3,6 +3,9 @@ AutoTruth Lifecycle Scorer
 Scores disclosure coverage across 6 lifecycle pillars.
 """
 
+from functools import lru_cache
+from typing import Sequence
+
 PILLAR_WEIGHTS = {
     "raw_materials": 0.20,
     "manufacturing": 0.20,
@@ -12,6 +15,9 @@ PILLAR_WEIGHTS = {
     "offsets": 0.10,
 }
 
+# Fixed pillar order for the batch (matrix) form of pillar scores
+PILLAR_ORDER = tuple(PILLAR_WEIGHTS)
+
 PILLAR_LABELS = {
     "raw_materials": "Raw Material Extraction",
     "manufacturing": "Manufacturing & Energy",
@@ -22,15 +28,34 @@ PILLAR_LABELS = {
 }
 
 
+# NumPy is only needed by the batch path, so it is imported on first use
+@lru_cache(maxsize=1)
+def weights_vector():
+    """PILLAR_WEIGHTS as a float64 vector in PILLAR_ORDER."""
+    import numpy as np
+
+    return np.array([PILLAR_WEIGHTS[p] for p in PILLAR_ORDER], dtype=np.float64)
+
+
 def compute_weighted_score(pillar_scores: dict) -> float:
     """Compute weighted total score from pillar scores (0-100)."""
     total = 0.0
     for pillar, weight in PILLAR_WEIGHTS.items():
-        score = pillar_scores.get(pillar, 0)
-        total += score * weight
+        total += pillar_scores.get(pillar, 0) * weight
     return round(total, 2)
 
 
+def compute_weighted_scores(pillar_score_dicts: Sequence[dict]) -> list[float]:
+    """compute_weighted_score for many companies as one (N, 6) product and row sum."""
+    import numpy as np
+
+    matrix = np.array(
+        [[scores.get(p, 0) for p in PILLAR_ORDER] for scores in pillar_score_dicts], dtype=np.float64
+    ).reshape(-1, len(PILLAR_ORDER))
+    # Multiply-then-sum adds the six terms in order, matching compute_weighted_score bit for bit
+    return [round(total, 2) for total in (matrix * weights_vector()).sum(axis=1).tolist()]
+
+
 def compute_drift(current: dict, previous: dict) -> dict:
     """Compute year-over-year score drift per pillar."""
     drift = {}
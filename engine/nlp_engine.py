@@ -7,13 +7,18 @@ using keyword rules + pattern matching (no internet required)
 import re
 
 # Keyword dictionaries for classification
-NUMERIC_PATTERNS = [
-    r'\d+\.?\d*\s*%',
-    r'\d+\.?\d*\s*(tonnes?|tons?|kg|kWh|MWh|GWh|gCO2|km|mi|g/km)',
-    r'(reduced|decreased|improved|increased|achieved|recovered)\s+by\s+\d+',
-    r'\d+\s*(million|billion|thousand)',
-    r'(zero|100%)\s+(cobalt|offset|renewable|recycl)',
-]
+# A claim is NUMERIC when it matches any of these rules (the digit-led ones share their \d+ prefix)
+NUMERIC_RE = re.compile(
+    r"""
+    \d+(?:
+        \.?\d*\s*(?:%|tonnes?|tons?|kg|kWh|MWh|GWh|gCO2|km|mi|g/km)   # 12%, 4.5 tonnes, 300 kWh
+        | \s*(?:million|billion|thousand)                             # 3 million
+    )
+    | (?:reduced|decreased|improved|increased|achieved|recovered)\s+by\s+\d+   # reduced by 40
+    | (?:zero|100%)\s+(?:cobalt|offset|renewable|recycl)              # zero cobalt, 100% renewable
+    """,
+    re.IGNORECASE | re.VERBOSE,
+)
 
 VAGUE_PHRASES = [
     'committed to', 'strives to', 'works toward', 'we believe', 'eco-friendly',
@@ -40,32 +45,33 @@ OFFSET_QUALITY_MAP = {
 }
 
 
-def classify_claim(text: str) -> dict:
-    """Classify a single claim text into NUMERIC, VAGUE, or OFFSET_BACKED."""
-    text_lower = text.lower()
+_OFFSET_PHRASES_LOWER = [p.lower() for p in OFFSET_PHRASES]
+_SENTENCE_BREAK_RE = re.compile(r'(?<=[.!?])\s+')
+
 
+def _classify(text: str, text_lower: str) -> dict:
     # Check OFFSET first (most specific)
-    for phrase in OFFSET_PHRASES:
-        if phrase.lower() in text_lower:
-            quality = "Unverified"
-            for key, val in OFFSET_QUALITY_MAP.items():
-                if key in text_lower:
-                    quality = val
-                    break
-            return {
-                "type": "OFFSET_BACKED",
-                "offset_quality": quality,
-                "confidence": round(0.85 + (0.1 if any(p in text_lower for p in ['gold standard', 'verified']) else 0), 2)
-            }
+    if any(phrase in text_lower for phrase in _OFFSET_PHRASES_LOWER):
+        quality = "Unverified"
+        for key, val in OFFSET_QUALITY_MAP.items():
+            if key in text_lower:
+                quality = val
+                break
+        # 'gold standard' is the top-priority key, so the quality lookup already answered that half
+        verified = quality == "Gold Standard" or 'verified' in text_lower
+        return {
+            "type": "OFFSET_BACKED",
+            "offset_quality": quality,
+            "confidence": round(0.85 + (0.1 if verified else 0), 2)
+        }
 
     # Check NUMERIC
-    for pattern in NUMERIC_PATTERNS:
-        if re.search(pattern, text, re.IGNORECASE):
-            return {
-                "type": "NUMERIC",
-                "offset_quality": None,
-                "confidence": round(0.88 + (0.07 if '%' in text else 0), 2)
-            }
+    if NUMERIC_RE.search(text):
+        return {
+            "type": "NUMERIC",
+            "offset_quality": None,
+            "confidence": round(0.88 + (0.07 if '%' in text else 0), 2)
+        }
 
     # Default VAGUE
     vague_score = sum(1 for phrase in VAGUE_PHRASES if phrase in text_lower)
@@ -77,29 +83,53 @@ def classify_claim(text: str) -> dict:
     }
 
 
-def extract_and_classify_claims(text: str) -> list:
-    """Split text into sentences and classify each."""
-    sentences = re.split(r'(?<=[.!?])\s+', text.strip())
-    results = []
-    for sentence in sentences:
-        sentence = sentence.strip()
+def classify_claim(text: str) -> dict:
+    """Classify a single claim text into NUMERIC, VAGUE, or OFFSET_BACKED."""
+    return _classify(text, text.lower())
+
+
+def _sentence_spans(text: str):
+    """(start, end) of each sentence, splitting after . ! or ? followed by whitespace."""
+    start = 0
+    for m in _SENTENCE_BREAK_RE.finditer(text):
+        yield start, m.start()
+        start = m.end()
+    yield start, len(text)
+
+
+def extract_and_classify_claims(text: str, limit: int | None = None) -> list:
+    """Split text into sentences and classify each, stopping after `limit` claims if given."""
+    text = text.strip()
+    text_lower = text.lower()
+    # Slicing the lowercased copy is only safe if lowercasing kept every offset (rare non-ASCII breaks it)
+    aligned = len(text_lower) == len(text)
+    results: list[dict] = []
+    for start, end in _sentence_spans(text):
+        if limit is not None and len(results) >= limit:
+            break
+        sentence = text[start:end].strip()
         if len(sentence) > 20:
-            classification = classify_claim(sentence)
+            sentence_lower = text_lower[start:end].strip() if aligned else sentence.lower()
             results.append({
                 "text": sentence,
-                **classification
+                **_classify(sentence, sentence_lower)
             })
     return results
 
 
 def get_claim_quality_ratio(claims: list) -> dict:
     """Returns ratio of NUMERIC, VAGUE, OFFSET_BACKED claims."""
-    total = len(claims)
-    if total == 0:
-        return {"numeric": 0, "vague": 0, "offset": 0}
     counts = {"NUMERIC": 0, "VAGUE": 0, "OFFSET_BACKED": 0}
     for claim in claims:
         counts[claim.get("type", "VAGUE")] += 1
+    return claim_quality_ratio_from_counts(counts)
+
+
+def claim_quality_ratio_from_counts(counts: dict) -> dict:
+    """get_claim_quality_ratio for claims whose types are already tallied by the caller."""
+    total = sum(counts.values())
+    if total == 0:
+        return {"numeric": 0, "vague": 0, "offset": 0}
     return {
         "numeric": round(counts["NUMERIC"] / total, 3),
         "vague": round(counts["VAGUE"] / total, 3),
@@ -34,7 +34,7 @@ def analyze_offsets(offset_dependency_pct: float, offset_quality: str) -> dict:
     quality_score = QUALITY_SCORES.get(offset_quality, 25)
     
     # Compute penalty based on dependency + quality
-    dependency_penalty = 0
+    dependency_penalty: float = 0
     if offset_quality == "None":
         dependency_penalty = 0
     elif offset_dependency_pct > OFFSET_THRESHOLD:
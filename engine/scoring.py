@@ -2,11 +2,24 @@
 AutoTruth Scoring Algorithm
 Aggregates pillar scores, claim quality, offset penalty, and regulatory alignment
 into a final Lifecycle Transparency Score (LTS) out of 100.
+
+The module stays mypyc-compilable (see README). Values that reach the JSON output are
+annotated Any or int | float, never plain float: compiled code keeps float variables as
+C doubles, which would turn a clipped int 0 into 0.0.
 """
 
-from engine.lifecycle_scorer import compute_weighted_score
+import os
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Sequence
+
+from engine.lifecycle_scorer import compute_weighted_score, compute_weighted_scores
 from engine.offset_detector import analyze_offsets
-from engine.nlp_engine import get_claim_quality_ratio
+from engine.nlp_engine import claim_quality_ratio_from_counts
+
+if TYPE_CHECKING:
+    import numpy as np
 
 # Regulatory standards and their point bonuses
 REGULATORY_BONUSES = {
@@ -15,13 +28,24 @@ REGULATORY_BONUSES = {
     "SEC_Climate": 2.5,
     "TCFD": 1.5,
 }
+REGULATORY_BONUS_CAP = 8.0  # Cap total regulatory bonus at 8 points
+_STANDARDS = tuple(REGULATORY_BONUSES)
 
-RISK_TIERS = [
+RISK_TIERS = (
     (80, "Transparent", "#00e676", "✅ High Transparency — claims are well-substantiated and disclosure is comprehensive."),
     (60, "Moderate", "#ffeb3b", "⚠️ Moderate Transparency — some pillars are well-documented, but gaps remain."),
     (40, "Opaque", "#ff9800", "🟠 Opaque Disclosures — significant claim vagueness and lifecycle gaps detected."),
     (0,  "Greenwashing", "#f44336", "🚨 Greenwashing Detected — disclosures are primarily vague, offset-dependent, or misleading."),
-]
+)
+
+# Below this many companies, worker start-up and pickling cost more than scoring in-process
+PARALLEL_MIN_COMPANIES = 5000
+
+# Layouts compute_lts can return the fingerprinted claims in
+CLAIMS_FORMATS = ("records", "columns")
+
+# ESG index adjustment per offset risk level
+ESG_OFFSET_PENALTIES = {"LOW": 0, "MODERATE": -5, "HIGH": -15}
 
 # Rewrite suggestions for vague claim archetypes
 REWRITE_SUGGESTIONS = {
@@ -37,56 +61,90 @@ REWRITE_SUGGESTIONS = {
 }
 
 
-def suggest_rewrite(claim_text: str) -> str:
-    """Suggest a data-backed rewrite for a vague claim."""
+MAX_CACHED_CLAIM_CHARS = 512  # longer claim texts are not kept in the suggest_rewrite cache
+
+DEFAULT_REWRITE = "Replace vague language with specific metrics, timelines, and verified data sources."
+
+# Triggers in priority order
+_REWRITE_ITEMS = tuple(REWRITE_SUGGESTIONS.items())
+
+
+def _rewrite_for(claim_text: str) -> str:
     claim_lower = claim_text.lower()
-    for trigger, suggestion in REWRITE_SUGGESTIONS.items():
+    for trigger, suggestion in _REWRITE_ITEMS:
         if trigger in claim_lower:
             return suggestion
-    return "Replace vague language with specific metrics, timelines, and verified data sources."
+    return DEFAULT_REWRITE
+
+
+_rewrite_for_cached = lru_cache(maxsize=4096)(_rewrite_for)
+
+
+def suggest_rewrite(claim_text: str) -> str:
+    """Suggest a data-backed rewrite for a vague claim."""
+    # Claim text comes from uploads and is unbounded; only short texts are worth keeping
+    if len(claim_text) > MAX_CACHED_CLAIM_CHARS:
+        return _rewrite_for(claim_text)
+    return _rewrite_for_cached(claim_text)
 
 
-def compute_regulatory_bonus(alignment: dict) -> float:
+def compute_regulatory_bonus(alignment: dict[str, Any]) -> float:
     """Sum bonuses for meeting regulatory disclosure standards."""
     bonus = 0.0
     for standard, met in alignment.items():
         if met:
             bonus += REGULATORY_BONUSES.get(standard, 0)
-    return min(bonus, 8.0)  # Cap total regulatory bonus at 8 points
+    return min(bonus, REGULATORY_BONUS_CAP)
 
 
-def classify_risk(score: float) -> dict:
-    """Return risk tier for a given LTS score."""
-    for threshold, label, color, description in RISK_TIERS:
-        if score >= threshold:
-            return {"label": label, "color": color, "description": description}
-    return {"label": "Greenwashing", "color": "#f44336", "description": RISK_TIERS[-1][3]}
+def compute_regulatory_bonus_batch(alignments: Sequence[dict[str, Any]]) -> "np.ndarray":
+    """compute_regulatory_bonus for many alignment dicts as one (N, standards) matrix product."""
+    import numpy as np  # imported on first batch use; single-company scoring never needs it
 
+    bonus_vec = np.array([REGULATORY_BONUSES[s] for s in _STANDARDS], dtype=np.float64)
+    met = np.array(
+        [[bool(alignment.get(s)) for s in _STANDARDS] for alignment in alignments], dtype=np.float64
+    ).reshape(len(alignments), len(_STANDARDS))
+    # Every bonus is a multiple of 0.5, so the product is exact whatever the summation order
+    return np.minimum(met @ bonus_vec, REGULATORY_BONUS_CAP)
 
-def compute_investor_esg_index(lts_score: float, offset_risk: str) -> dict:
+
+# RISK_TIERS in ascending threshold order, with each tier's result built once
+_RISK_THRESHOLDS = tuple(threshold for threshold, *_ in reversed(RISK_TIERS))
+_RISK_RESULTS = tuple(
+    {"label": label, "color": color, "description": description}
+    for _, label, color, description in reversed(RISK_TIERS)
+)
+
+
+def classify_risk(score: float) -> dict[str, str]:
+    """Return risk tier for a given LTS score (a shared dict; do not mutate)."""
+    # Negative scores and NaN fail this test and land in the lowest (Greenwashing) tier
+    if score >= _RISK_THRESHOLDS[0]:
+        return _RISK_RESULTS[bisect_right(_RISK_THRESHOLDS, score) - 1]
+    return _RISK_RESULTS[0]
+
+
+# ESG rating ladder: _ESG_LADDER[i] applies from _ESG_THRESHOLDS[i - 1] (inclusive) upward
+_ESG_THRESHOLDS = (30, 45, 60, 75)
+_ESG_LADDER = (
+    ("CCC", "High ESG risk — greenwashing exposure"),
+    ("BB", "Elevated ESG risk — significant disclosure weaknesses"),
+    ("BBB", "Moderate ESG risk — gaps in lifecycle reporting"),
+    ("AA", "Low-moderate ESG risk"),
+    ("AAA", "Minimal ESG disclosure risk"),
+)
+
+
+def compute_investor_esg_index(lts_score: Any, offset_risk: str) -> dict[str, Any]:
     """
     Derive an ESG confidence index for investors based on LTS.
     Higher LTS = lower ESG financial risk.
     """
     base = lts_score
-    offset_penalty_map = {"LOW": 0, "MODERATE": -5, "HIGH": -15}
-    adjusted = max(0, base + offset_penalty_map.get(offset_risk, 0))
+    adjusted: Any = max(0, base + ESG_OFFSET_PENALTIES.get(offset_risk, 0))
     
-    if adjusted >= 75:
-        rating = "AAA"
-        interpretation = "Minimal ESG disclosure risk"
-    elif adjusted >= 60:
-        rating = "AA"
-        interpretation = "Low-moderate ESG risk"
-    elif adjusted >= 45:
-        rating = "BBB"
-        interpretation = "Moderate ESG risk — gaps in lifecycle reporting"
-    elif adjusted >= 30:
-        rating = "BB"
-        interpretation = "Elevated ESG risk — significant disclosure weaknesses"
-    else:
-        rating = "CCC"
-        interpretation = "High ESG risk — greenwashing exposure"
+    rating, interpretation = _ESG_LADDER[bisect_right(_ESG_THRESHOLDS, adjusted)]
 
     return {
         "score": round(adjusted, 1),
@@ -95,36 +153,189 @@ def compute_investor_esg_index(lts_score: float, offset_risk: str) -> dict:
     }
 
 
-def compute_lts(company_data: dict) -> dict:
+@dataclass(slots=True, frozen=True)
+class CompanyInput:
+    """
+    Pre-parsed compute_lts input for pipelines that score the same companies repeatedly.
+    Fields mirror the company dict keys and defaults; reading them is a slot access,
+    not a dict.get with a fallback.
     """
-    Full LTS computation pipeline for one company.
+    name: str | None = None
+    model: str | None = None
+    report_year: int | None = None
+    claims: list[dict[str, Any]] = field(default_factory=list)
+    pillar_scores: dict[str, float] = field(default_factory=dict)
+    prior_year_scores: dict[str, float] = field(default_factory=dict)
+    offset_dependency: int | float = 0
+    offset_quality: str = "Unverified"
+    regulatory_alignment: dict[str, Any] = field(default_factory=dict)
+    grid_carbon_intensity_gco2_kwh: int | float = 400
+
+    @classmethod
+    def from_dict(cls, company_data: dict[str, Any]) -> "CompanyInput":
+        """Build from a company dict, ignoring keys compute_lts does not read (id, logo, ...)."""
+        return cls(**{k: company_data[k] for k in cls.__dataclass_fields__ if k in company_data})
+
+    def __reduce__(self):
+        # Rebuild through __init__: the default frozen-slots unpickling assigns fields, which
+        # mypyc-compiled frozen classes reject (breaking pickle, deepcopy and score_companies)
+        return (CompanyInput, tuple(getattr(self, f) for f in self.__dataclass_fields__))
+
+
+@lru_cache(maxsize=64, typed=True)
+def _zero_offset_analysis(offset_dep: Any, offset_quality: str) -> dict[str, Any]:
+    # typed: a 0 and a 0.0 dependency echo back as different JSON numbers
+    return analyze_offsets(offset_dep, offset_quality)
+
+
+def _pillars_and_regulatory(company: dict[str, Any] | CompanyInput) -> tuple[dict, dict]:
+    if isinstance(company, CompanyInput):
+        return company.pillar_scores, company.regulatory_alignment
+    return company.get("pillar_scores", {}), company.get("regulatory_alignment", {})
+
+
+def compute_lts(company_data: dict[str, Any] | CompanyInput, claims_format: str = "records") -> dict[str, Any]:
+    """
+    Full LTS computation pipeline for one company (a company dict or CompanyInput).
     Returns complete scoring breakdown.
+
+    claims_format="columns" returns the fingerprinted claims as one list per field
+    ({"text": [...], "impact_score": [...], ...}) instead of one dict per claim; claims
+    missing a field hold None in that column. The text, type, impact_score and
+    rewrite_suggestion columns are always present, even with no claims. The mapping
+    feeds straight into pyarrow.RecordBatch.from_pydict or pandas.DataFrame.
     """
-    claims = company_data.get("claims", [])
-    pillar_scores = company_data.get("pillar_scores", {})
-    prior_year = company_data.get("prior_year_scores", {})
-    offset_dep = company_data.get("offset_dependency", 0)
-    offset_quality = company_data.get("offset_quality", "Unverified")
-    regulatory = company_data.get("regulatory_alignment", {})
-    grid_intensity = company_data.get("grid_carbon_intensity_gco2_kwh", 400)
-
-    # 1. Weighted pillar score (base)
+    pillar_scores, regulatory = _pillars_and_regulatory(company_data)
+    # 1. Weighted pillar score (base) and 4. regulatory alignment bonus
     pillar_total = compute_weighted_score(pillar_scores)
+    regulatory_bonus = compute_regulatory_bonus(regulatory) if regulatory else 0.0
+    return _lts_breakdown(company_data, pillar_total, regulatory_bonus, claims_format)
+
+
+def compute_lts_batch(
+    companies: Sequence[dict[str, Any] | CompanyInput], claims_format: str = "records"
+) -> list[dict[str, Any]]:
+    """
+    compute_lts for many companies; results are identical to scoring each one.
+    Pillar totals and regulatory bonuses are computed for the whole batch as NumPy matrix
+    products; per-claim fingerprinting stays per company.
+    """
+    pillars, regulatory = zip(*map(_pillars_and_regulatory, companies)) if companies else ((), ())
+    pillar_totals = compute_weighted_scores(pillars)
+    regulatory_bonuses = compute_regulatory_bonus_batch(regulatory).tolist()
+    return [
+        _lts_breakdown(company_data, pillar_total, regulatory_bonus, claims_format)
+        for company_data, pillar_total, regulatory_bonus in zip(companies, pillar_totals, regulatory_bonuses)
+    ]
+
+
+def score_companies(
+    companies: Sequence[dict[str, Any] | CompanyInput],
+    workers: int | None = None,
+    claims_format: str = "records",
+) -> list[dict[str, Any]]:
+    """
+    compute_lts for every company, in order. Large batches are split into contiguous
+    chunks and scored by compute_lts_batch in worker processes; small ones run in-process.
+    """
+    workers = workers or min(4, os.cpu_count() or 1)
+    if workers <= 1 or len(companies) < PARALLEL_MIN_COMPANIES:
+        return compute_lts_batch(companies, claims_format)
+
+    from concurrent.futures import ProcessPoolExecutor  # only large batches pay for the import
+    from functools import partial
+
+    # A few chunks per worker keeps them busy without paying per-company pickling round trips
+    step = -(-len(companies) // (workers * 4))
+    chunks = [companies[i:i + step] for i in range(0, len(companies), step)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return [result for chunk in pool.map(partial(compute_lts_batch, claims_format=claims_format), chunks) for result in chunk]
+
+
+def _lts_breakdown(
+    company_data: dict[str, Any] | CompanyInput,
+    pillar_total: float,
+    regulatory_bonus: float,
+    claims_format: str = "records",
+) -> dict[str, Any]:
+    if claims_format not in CLAIMS_FORMATS:
+        raise ValueError(f"claims_format must be one of {CLAIMS_FORMATS}, got {claims_format!r}")
+    if isinstance(company_data, CompanyInput):
+        name, model, report_year = company_data.name, company_data.model, company_data.report_year
+        claims = company_data.claims
+        pillar_scores = company_data.pillar_scores
+        prior_year = company_data.prior_year_scores
+        offset_dep = company_data.offset_dependency
+        offset_quality = company_data.offset_quality
+        regulatory = company_data.regulatory_alignment
+        grid_intensity = company_data.grid_carbon_intensity_gco2_kwh
+    else:
+        name, model, report_year = company_data.get("name"), company_data.get("model"), company_data.get("report_year")
+        claims = company_data.get("claims", [])
+        pillar_scores = company_data.get("pillar_scores", {})
+        prior_year = company_data.get("prior_year_scores", {})
+        offset_dep = company_data.get("offset_dependency", 0)
+        offset_quality = company_data.get("offset_quality", "Unverified")
+        regulatory = company_data.get("regulatory_alignment", {})
+        grid_intensity = company_data.get("grid_carbon_intensity_gco2_kwh", 400)
+
+    # 9. Greenwash fingerprint per claim, in the same pass that tallies claim types for step 2
+    offset_claim_impact = -12 if offset_quality == "Unverified" else 0
+    type_counts = {"NUMERIC": 0, "VAGUE": 0, "OFFSET_BACKED": 0}
+    fingerprinted_claims: Any = []
+    as_columns = claims_format == "columns"
+    if as_columns:
+        impact_scores: list[int] = []
+        rewrites: list[str | None] = []
+    for claim in claims:
+        claim_type = claim["type"]
+        type_counts[claim_type] += 1
+        rewrite = None
+        if claim_type == "VAGUE":
+            fp_score = -8
+            rewrite = suggest_rewrite(claim["text"])
+        elif claim_type == "OFFSET_BACKED":
+            fp_score = offset_claim_impact
+        elif claim_type == "NUMERIC" and claim.get("verified", False):
+            fp_score = +5
+        else:
+            fp_score = 0
+
+        if as_columns:
+            impact_scores.append(fp_score)
+            rewrites.append(rewrite)
+            continue
+
+        # dict.copy() clones the claim's hash table directly; a {**claim, ...} literal re-inserts every key
+        entry = claim.copy()
+        entry["impact_score"] = fp_score
+        entry["rewrite_suggestion"] = rewrite
+        fingerprinted_claims.append(entry)
+
+    if as_columns:
+        # text and type always lead, so the layout does not depend on which claims exist; then every
+        # other field any claim carries, in first-seen order (claims without it hold None)
+        fields = {"text": None, "type": None, **dict.fromkeys(key for claim in claims for key in claim)}
+        columns: dict[str, list[Any]] = {key: [claim.get(key) for claim in claims] for key in fields}
+        columns["impact_score"] = impact_scores
+        columns["rewrite_suggestion"] = rewrites
+        fingerprinted_claims = columns
 
     # 2. Claim quality ratio
-    claim_ratio = get_claim_quality_ratio(claims)
+    claim_ratio = claim_quality_ratio_from_counts(type_counts)
     # Numeric claims boost score; vague claims penalize
     claim_quality_adjustment = round(
         (claim_ratio["numeric"] * 8) - (claim_ratio["vague"] * 6), 2
     )
 
     # 3. Offset analysis
-    offset_analysis = analyze_offsets(offset_dep, offset_quality)
+    if offset_dep:
+        offset_analysis = analyze_offsets(offset_dep, offset_quality)
+    else:
+        # Companies with no offsets share one analysis per quality tier; copied so results stay independent
+        offset_analysis = _zero_offset_analysis(offset_dep, offset_quality).copy()
     offset_penalty = offset_analysis["dependency_penalty"]
 
-    # 4. Regulatory alignment bonus
-    regulatory_bonus = compute_regulatory_bonus(regulatory)
-
     # 5. Grid carbon adjustment (higher intensity = small downward pressure on use_phase)
     grid_penalty = 0
     if grid_intensity > 500:
@@ -134,7 +345,7 @@ def compute_lts(company_data: dict) -> dict:
 
     # 6. Final LTS
     raw_lts = pillar_total + claim_quality_adjustment - offset_penalty + regulatory_bonus + grid_penalty
-    lts = round(max(0, min(100, raw_lts)), 1)
+    lts: Any = round(max(0, min(100, raw_lts)), 1)
 
     # 7. Risk classification
     risk = classify_risk(lts)
@@ -142,29 +353,10 @@ def compute_lts(company_data: dict) -> dict:
     # 8. ESG Investor Index
     esg_index = compute_investor_esg_index(lts, offset_analysis["risk_level"])
 
-    # 9. Greenwash fingerprint per claim
-    fingerprinted_claims = []
-    for claim in claims:
-        fp_score = 0
-        if claim["type"] == "VAGUE":
-            fp_score = -8
-        elif claim["type"] == "OFFSET_BACKED" and offset_quality == "Unverified":
-            fp_score = -12
-        elif claim["type"] == "NUMERIC" and claim.get("verified", False):
-            fp_score = +5
-        
-        entry = dict(claim)
-        entry["impact_score"] = fp_score
-        if claim["type"] == "VAGUE":
-            entry["rewrite_suggestion"] = suggest_rewrite(claim["text"])
-        else:
-            entry["rewrite_suggestion"] = None
-        fingerprinted_claims.append(entry)
-
     return {
-        "company": company_data.get("name"),
-        "model": company_data.get("model"),
-        "report_year": company_data.get("report_year"),
+        "company": name,
+        "model": model,
+        "report_year": report_year,
         "lts": lts,
         "risk": risk,
         "breakdown": {
@@ -0,0 +1,12 @@
+"""
+AutoTruth — gunicorn settings
+Threaded workers so one slow PDF upload does not block the lighter API calls.
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '5001')}"
+workers = int(os.environ.get("WEB_CONCURRENCY", os.cpu_count() or 1))
+worker_class = "gthread"
+threads = int(os.environ.get("GUNICORN_THREADS", 4))
+timeout = 120